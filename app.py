@@ -1,3 +1,5 @@
+import logging
+import sys
 from pathlib import Path
 # import matplotlib.pyplot as plt # No longer directly used here
 # import networkx as nx # No longer directly used here for drawing
@@ -6,18 +8,20 @@ from utils.data_processor import load_json_data, validate_data
 from utils.graph_builder import create_networkx_graph
 from utils.matplotlib_visualizer import draw_graph_matplotlib
 
+logger = logging.getLogger(__name__)
+
 def main():
     sample_data_path = Path("assets/sample_data.json")
     output_image_path = Path("knowledge_graph.png") # Output path for the graph image
 
     if not sample_data_path.exists():
-        print(f"Error: Sample data not found at {sample_data_path}")
+        logger.error("Sample data not found at %s", sample_data_path)
         return
 
     edges_df, node_info_map = load_json_data(sample_data_path)
 
     if not validate_data(edges_df) or not node_info_map:
-        print("Error: Invalid data format. Ensure JSON has valid nodes and edges.")
+        logger.error("Invalid data format. Ensure JSON has valid nodes and edges.")
         return
 
     nx_graph = create_networkx_graph(edges_df, node_info_map)
@@ -36,4 +40,5 @@ def main():
     # The print statement for success is now inside draw_graph_matplotlib
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", stream=sys.stdout)
     main()
@@ -1,96 +1,130 @@
-import json
+import mmap
+import os
+from functools import singledispatch
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
+try:
+    import orjson as _json
+    _LOADS_ACCEPTS_BUFFER = True
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+    _LOADS_ACCEPTS_BUFFER = False
+
+EDGE_COLUMNS = ["head", "head_type", "relation", "tail", "tail_type"]
+EXPECTED_COLUMNS = frozenset(EDGE_COLUMNS)
+NODE_ID_COLUMNS = ["head", "tail"]
+ESSENTIAL_COLUMNS = ["head", "relation", "tail"]
+TYPE_COLUMNS = ["head_type", "tail_type"]
+LABEL_COLUMNS = TYPE_COLUMNS + ["relation"]
+EDGE_COLUMN_DTYPES = {"head_type": "category", "relation": "category", "tail_type": "category"}
+MMAP_MIN_FILE_SIZE = 1024 * 1024
+
+
+def _parse_json_file(file_path: Path):
+    with open(file_path, "rb") as f:
+        if _LOADS_ACCEPTS_BUFFER and os.fstat(f.fileno()).st_size >= MMAP_MIN_FILE_SIZE:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mapped = None
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    return _json.loads(view)
+        return _json.loads(f.read())
+
+@singledispatch
+def _parse_source(source_input):
+    if not hasattr(source_input, 'read'):
+        return None
+    if hasattr(source_input, 'getvalue'):
+        raw_content = source_input.getvalue()
+    else:
+        raw_content = source_input.read()
+    if not raw_content or not isinstance(raw_content, (bytes, str)):
+        return None
+    return _json.loads(raw_content)
+
+@_parse_source.register(str)
+@_parse_source.register(Path)
+def _parse_path_source(source_input):
+    file_path = Path(source_input)
+    if not file_path.exists() or not file_path.is_file():
+        return None
+    return _parse_json_file(file_path)
 
 def load_json_data(source_input):
-    empty_df = pd.DataFrame(columns=["head", "head_type", "relation", "tail", "tail_type"])
+    empty_df = pd.DataFrame(columns=EDGE_COLUMNS)
     empty_node_map = {}
 
     if source_input is None:
         return empty_df, empty_node_map
 
-    raw_content = None
-
     try:
-        if hasattr(source_input, 'read'):
-            if hasattr(source_input, 'getvalue'):
-                raw_content_bytes = source_input.getvalue()
-            else:
-                raw_content_bytes = source_input.read()
-            if not isinstance(raw_content_bytes, bytes):
-                if isinstance(raw_content_bytes, str):
-                    raw_content = raw_content_bytes
-                else:
-                    return empty_df, empty_node_map
-            else:
-                raw_content = raw_content_bytes.decode("utf-8")
-        elif isinstance(source_input, (str, Path)):
-            file_path = Path(source_input)
-            if not file_path.exists() or not file_path.is_file():
-                return empty_df, empty_node_map
-            raw_content_bytes = file_path.read_bytes()
-            raw_content = raw_content_bytes.decode("utf-8")
-        else:
-            return empty_df, empty_node_map
-
-        if not raw_content:
-            return empty_df, empty_node_map
-
-        data = json.loads(raw_content)
-        if not isinstance(data, dict):
-            return empty_df, empty_node_map
-        if not isinstance(data.get('nodes'), list) or not isinstance(data.get('edges'), list):
-            return empty_df, empty_node_map
-
+        data = _parse_source(source_input)
         nodes_data = data['nodes']
         edges_data = data['edges']
+        if not isinstance(nodes_data, list) or not isinstance(edges_data, list):
+            return empty_df, empty_node_map
 
         node_info_map = {}
+        node_types_by_source = {}
         for node in nodes_data:
             node_id = node.get('id')
             if not node_id:
                 continue
             source_file = node.get('source_file')
             node_attributes = node.get('attributes', [])
-            node_type = node_id
-            if source_file and isinstance(source_file, str) and '.' in source_file:
-                node_type = source_file.split('.')[0]
-            elif source_file:
-                node_type = source_file
+            if source_file and isinstance(source_file, str):
+                node_type = node_types_by_source.get(source_file)
+                if node_type is None:
+                    node_type = node_types_by_source[source_file] = source_file.partition('.')[0]
+            else:
+                node_type = source_file or node_id
             node_info_map[node_id] = {'type': node_type, 'attributes': node_attributes}
 
-        processed_edges = []
+        heads, head_types, relations, tails, tail_types = [], [], [], [], []
+        get_node_info = node_info_map.get
         for edge in edges_data:
             head_id = edge.get('from')
             tail_id = edge.get('to')
             relation = edge.get('label')
-            if not all([head_id, tail_id, relation]):
+            if not (head_id and tail_id and relation):
                 continue
-            head_node_info = node_info_map.get(head_id)
-            tail_node_info = node_info_map.get(tail_id)
+            head_node_info = get_node_info(head_id)
+            tail_node_info = get_node_info(tail_id)
             if not head_node_info or not tail_node_info:
                 continue
             head_type = head_node_info['type']
             tail_type = tail_node_info['type']
-            processed_edges.append({
-                "head": head_id,
-                "head_type": head_type,
-                "relation": relation,
-                "tail": tail_id,
-                "tail_type": tail_type
-            })
-
-        if not processed_edges and not edges_data:
-            return empty_df, node_info_map
+            heads.append(head_id)
+            head_types.append(head_type)
+            relations.append(relation)
+            tails.append(tail_id)
+            tail_types.append(tail_type)
 
-        edges_df = pd.DataFrame(processed_edges)
-        if edges_df.empty:
+        if not heads and not edges_data:
             return empty_df, node_info_map
 
-        expected_columns = ["head", "head_type", "relation", "tail", "tail_type"]
-        if not all(col in edges_df.columns for col in expected_columns):
+        edges_df = pd.DataFrame({
+            "head": heads,
+            "head_type": head_types,
+            "relation": relations,
+            "tail": tails,
+            "tail_type": tail_types
+        })
+        for col, dtype in EDGE_COLUMN_DTYPES.items():
+            try:
+                edges_df[col] = edges_df[col].astype(dtype)
+            except TypeError:
+                # Unhashable values (e.g. a list source_file) can't be categories; keep the column as is.
+                pass
+        if not validate_data(edges_df):
             return empty_df, node_info_map
 
         return edges_df, node_info_map
@@ -101,35 +135,71 @@ def load_json_data(source_input):
 def validate_data(df: pd.DataFrame) -> bool:
     if df is None or df.empty:
         return False
-    required_columns = ["head", "head_type", "relation", "tail", "tail_type"]
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        return False
-    return True
+    return EXPECTED_COLUMNS.issubset(df.columns)
 
-def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+def _normalize_labels(series: pd.Series, fill_value: Optional[str] = None) -> pd.Categorical:
+    try:
+        codes, uniques = pd.factorize(series)
+    except TypeError:
+        # Unhashable labels (e.g. lists) can't be factorized; normalize row by row.
+        return pd.Categorical(series.astype(str).str.lower().str.strip())
+    labels = pd.Series(uniques, dtype=object).astype(str).str.lower().str.strip()
+    na_rows = codes < 0
+    if na_rows.any():
+        # factorize merges None and NaN, but str() tells them apart ('none' vs 'nan'),
+        # so missing rows are converted individually, as astype(str) would.
+        na_values = series[na_rows]
+        if fill_value is not None:
+            na_values = pd.Series(fill_value, index=na_values.index)
+        na_labels = na_values.astype(str).str.lower().str.strip()
+        codes = codes.copy()
+        codes[na_rows] = range(len(labels), len(labels) + len(na_labels))
+        labels = pd.concat([labels, na_labels], ignore_index=True)
+    label_codes, categories = pd.factorize(labels)
+    return pd.Categorical.from_codes(label_codes[codes], categories)
+
+def _clean_edges(df: pd.DataFrame, normalize: bool) -> pd.DataFrame:
+    """
+    Shared pass behind clean_data and clean_and_normalize: drops edges missing
+    head/relation/tail, fills missing types with "Unknown", casts the columns
+    that are not str yet in one block (with `normalize`, the label columns are
+    lowercased/stripped once per distinct value instead) and deduplicates once
+    at the end.
+    """
     if df is None or df.empty:
         return pd.DataFrame()
-    cleaned_df = df.copy()
-    essential_cols = ["head", "relation", "tail"]
-    type_cols = ["head_type", "tail_type"]
-    all_relevant_cols = essential_cols + type_cols
-    cleaned_df.dropna(subset=essential_cols, inplace=True)
-    for col in type_cols:
-        if col in cleaned_df.columns:
-            cleaned_df[col].fillna("Unknown", inplace=True)
-    for col in all_relevant_cols:
-        if col in cleaned_df.columns:
-            cleaned_df[col] = cleaned_df[col].astype(str)
-    cleaned_df.drop_duplicates(inplace=True)
-    return cleaned_df
+    cleaned_df = df.dropna(subset=ESSENTIAL_COLUMNS)
+    present_label_cols = [col for col in LABEL_COLUMNS if col in cleaned_df.columns]
+    present_type_cols = [col for col in TYPE_COLUMNS if col in present_label_cols]
+    if normalize:
+        updates = {col: _normalize_labels(cleaned_df[col], "Unknown" if col in present_type_cols else None)
+                   for col in present_label_cols}
+        cols_to_cast = NODE_ID_COLUMNS
+    else:
+        # Categorical columns only accept "Unknown" as a fill value once it is a category.
+        # Only columns with missing values are touched, so no unused category appears.
+        missing_type_cols = [col for col in present_type_cols if cleaned_df[col].isna().any()]
+        cleaned_df = cleaned_df.assign(**{
+            col: cleaned_df[col].cat.add_categories("Unknown")
+            for col in missing_type_cols
+            if isinstance(cleaned_df[col].dtype, pd.CategoricalDtype)
+            and "Unknown" not in cleaned_df[col].cat.categories
+        }).fillna({col: "Unknown" for col in missing_type_cols})
+        updates = {}
+        cols_to_cast = NODE_ID_COLUMNS + present_label_cols
+    cols_to_cast = [col for col in cols_to_cast if not pd.api.types.is_string_dtype(cleaned_df[col])]
+    if cols_to_cast:
+        updates.update(cleaned_df[cols_to_cast].astype(str).items())
+    return cleaned_df.assign(**updates).drop_duplicates()
+
+def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+    return _clean_edges(df, normalize=False)
 
 def normalize_entities(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
-    normalized_df = df.copy()
-    columns_to_normalize = ["head_type", "tail_type", "relation"]
-    for col in columns_to_normalize:
-        if col in normalized_df.columns:
-            normalized_df[col] = normalized_df[col].astype(str).str.lower().str.strip()
-    return normalized_df
\ No newline at end of file
+    return df.assign(**{col: _normalize_labels(df[col]) for col in LABEL_COLUMNS if col in df.columns})
+
+def clean_and_normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Equivalent to normalize_entities(clean_data(df)) deduplicated, in a single pass."""
+    return _clean_edges(df, normalize=True)
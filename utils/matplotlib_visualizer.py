@@ -1,5 +1,17 @@
-import matplotlib.pyplot as plt
+import logging
+import sys
+import weakref
+
 import networkx as nx
+import numpy as np
+from matplotlib.figure import Figure
+
+try:
+    import igraph as ig
+except ImportError:
+    ig = None
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_NODE_COLOR = "#ADD8E6"  # Light Blue
 DEFAULT_NODE_SIZE = 1000
@@ -10,11 +22,108 @@ DEFAULT_ARROW_SIZE = 20
 DEFAULT_EDGE_COLOR = "#D3D3D3" # Light Gray
 DEFAULT_FIGURE_SIZE = (19, 15)
 DEFAULT_LAYOUT = "spring"
+DEFAULT_LAYOUT_BACKEND = "networkx"
+WARM_START_ITERATIONS = 15  # spring_layout iterations when refining given positions
+
+LAYOUT_FUNCTIONS = {
+    "spring": nx.spring_layout,
+    "circular": nx.circular_layout,
+    "kamada_kawai": nx.kamada_kawai_layout,
+    "random": nx.random_layout,
+    "shell": nx.shell_layout,
+    "spectral": nx.spectral_layout,
+}
+
+# igraph equivalents of the layouts above, computed in igraph's C core.
+IGRAPH_LAYOUT_METHODS = {
+    "spring": "layout_fruchterman_reingold",
+    "kamada_kawai": "layout_kamada_kawai",
+}
+
+# Layouts already computed for each graph object, keyed by (backend, layout type).
+# Entries disappear together with the graph they belong to.
+_LAYOUT_CACHE = weakref.WeakKeyDictionary()
+# Layouts that are meant to differ between renders and are never cached.
+UNCACHED_LAYOUTS = frozenset({"random"})
+
+def _igraph_layout(graph, layout_type, seed_pos=None):
+    ig_graph = ig.Graph.from_networkx(graph)
+    node_names = ig_graph.vs["_nx_name"]
+    layout_method = getattr(ig_graph, IGRAPH_LAYOUT_METHODS[layout_type])
+    if seed_pos is None:
+        layout = layout_method()
+    else:
+        # igraph needs a start position for every vertex.
+        start_pos = {**nx.circular_layout(graph), **seed_pos}
+        seed = [[float(c) for c in start_pos[name]] for name in node_names]
+        options = {"niter": WARM_START_ITERATIONS} if layout_type == "spring" else {}
+        layout = layout_method(seed=seed, **options)
+    # igraph returns plain lists; use one array so positions match NetworkX's ndarrays.
+    return dict(zip(node_names, np.array(layout.coords)))
+
+def _resolve_layout(layout_type, layout_backend):
+    """Falls back to the defaults (with a warning) for unknown or unavailable choices."""
+    if layout_type not in LAYOUT_FUNCTIONS:
+        logger.warning("Unknown layout type '%s'. Using spring layout as default.", layout_type)
+        layout_type = DEFAULT_LAYOUT
+    if layout_backend == "igraph" and (ig is None or layout_type not in IGRAPH_LAYOUT_METHODS):
+        logger.warning("igraph backend unavailable for layout '%s'. Using networkx.", layout_type)
+        layout_backend = "networkx"
+    elif layout_backend not in ("networkx", "igraph"):
+        logger.warning("Unknown layout backend '%s'. Using networkx.", layout_backend)
+        layout_backend = "networkx"
+    return layout_type, layout_backend
+
+def _copy_positions(pos):
+    return {node: xy.copy() for node, xy in pos.items()}
+
+def _get_layout(graph, layout_type, layout_backend=DEFAULT_LAYOUT_BACKEND):
+    """
+    Returns node positions for `graph`, reusing a previously computed layout
+    of the same type as long as the graph still has the same nodes and number
+    of edges. The "random" layout is recomputed on every call.
+    """
+    layout_type, layout_backend = _resolve_layout(layout_type, layout_backend)
+
+    if layout_type in UNCACHED_LAYOUTS:
+        return LAYOUT_FUNCTIONS[layout_type](graph)
+
+    graph_layouts = _LAYOUT_CACHE.setdefault(graph, {})
+    n_edges = graph.number_of_edges()
+    cached = graph_layouts.get((layout_backend, layout_type))
+    if cached is not None and cached[0] == n_edges and graph.nodes.keys() == cached[1].keys():
+        # Hand out copies of the coordinate arrays so callers (e.g. via
+        # return_pos) can't corrupt the cache, even by changing them in place.
+        return _copy_positions(cached[1])
+
+    if layout_backend == "igraph":
+        pos = _igraph_layout(graph, layout_type)
+    else:
+        pos = LAYOUT_FUNCTIONS[layout_type](graph)
+    graph_layouts[(layout_backend, layout_type)] = (n_edges, pos)
+    return _copy_positions(pos)
+
+def _refine_layout(graph, layout_type, pos, layout_backend=DEFAULT_LAYOUT_BACKEND):
+    """
+    Refines previously computed positions `pos` instead of laying the graph out
+    from scratch, with either backend. Only the spring and kamada_kawai layouts
+    accept initial positions; the rest fall back to `_get_layout`.
+    """
+    layout_type, layout_backend = _resolve_layout(layout_type, layout_backend)
+    if layout_type not in ("spring", "kamada_kawai"):
+        return _get_layout(graph, layout_type, layout_backend)
+    if layout_backend == "igraph":
+        return _igraph_layout(graph, layout_type, seed_pos=pos)
+    if layout_type == "spring":
+        return nx.spring_layout(graph, pos=pos, iterations=WARM_START_ITERATIONS)
+    # kamada_kawai_layout needs a start position for every node.
+    return nx.kamada_kawai_layout(graph, pos={**nx.circular_layout(graph), **pos})
 
 def draw_graph_matplotlib(
     graph,
     output_path="graph.png",
     layout_type=DEFAULT_LAYOUT,
+    layout_backend=DEFAULT_LAYOUT_BACKEND,
     node_color=DEFAULT_NODE_COLOR,
     node_size=DEFAULT_NODE_SIZE,
     font_size=DEFAULT_FONT_SIZE,
@@ -25,6 +134,8 @@ def draw_graph_matplotlib(
     figure_size=DEFAULT_FIGURE_SIZE,
     title="Knowledge Graph",
     background_color="#222222",
+    pos=None,
+    return_pos=False,
 ):
     """
     Draws a NetworkX graph using Matplotlib and saves it to a file.
@@ -32,7 +143,9 @@ def draw_graph_matplotlib(
     Args:
         graph (nx.Graph): The NetworkX graph to draw.
         output_path (str): The path to save the output image.
-        layout_type (str): The layout algorithm to use (e.g., "spring", "circular", "kamada_kawai").
+        layout_type (str): The layout algorithm to use (one of LAYOUT_FUNCTIONS, e.g. "spring", "circular", "kamada_kawai").
+        layout_backend (str): "networkx", or "igraph" to compute spring/kamada_kawai layouts with igraph
+            when it is installed (much faster on large graphs). Falls back to NetworkX otherwise.
         node_color (str): Color of the nodes.
         node_size (int): Size of the nodes.
         font_size (int): Font size for labels.
@@ -40,58 +153,65 @@ def draw_graph_matplotlib(
         arrow_size (int): Size of the arrows for directed graphs.
         figure_size (tuple): Size of the Matplotlib figure (width, height).
         title (str): Title of the graph.
+        pos (dict): Node positions from a previous render to start from. The spring and kamada_kawai
+            layouts refine them with either backend (spring with only WARM_START_ITERATIONS iterations);
+            other layouts, and an empty mapping, are laid out as if no positions were given.
+        return_pos (bool): If True, return the node positions used so they can be passed back as `pos`.
     """
     if not graph or not graph.nodes():
-        print("Error: Graph is empty or None. Cannot draw.")
-        return
+        logger.error("Graph is empty or None. Cannot draw.")
+        return None
 
-    fig, ax = plt.subplots(figsize=figure_size)
+    # A standalone Figure renders through Agg without pyplot, so no GUI backend
+    # is set up and nothing needs closing afterwards.
+    fig = Figure(figsize=figure_size)
+    ax = fig.subplots()
     ax.set_facecolor(background_color)
     fig.patch.set_facecolor(background_color) # Also set figure background
 
     # Determine layout
     # Scaling of positions is generally handled by NetworkX's layout functions
     # and Matplotlib's plotting, relative to the figure size.
-    if layout_type == "spring":
-        pos = nx.spring_layout(graph)
-    elif layout_type == "circular":
-        pos = nx.circular_layout(graph)
-    elif layout_type == "kamada_kawai":
-        pos = nx.kamada_kawai_layout(graph)
-    elif layout_type == "random":
-        pos = nx.random_layout(graph)
-    elif layout_type == "shell":
-        pos = nx.shell_layout(graph)
-    elif layout_type == "spectral":
-        pos = nx.spectral_layout(graph)
+    # Repeated renders of the same graph reuse the cached layout, or refine the
+    # positions handed in by the caller.
+    if not pos:
+        pos = _get_layout(graph, layout_type, layout_backend)
     else:
-        print(f"Warning: Unknown layout type '{layout_type}'. Using spring layout as default.")
-        pos = nx.spring_layout(graph)
+        pos = _refine_layout(graph, layout_type, pos, layout_backend)
 
-    nx.draw(
+    # The draw_networkx_* helpers are called with an explicit Axes: nx.draw and
+    # nx.draw_networkx go through pyplot (draw_if_interactive), and nx.draw also
+    # resets the figure background to white.
+    nx.draw_networkx_nodes(graph, pos, ax=ax, node_color=node_color, node_size=node_size)
+    nx.draw_networkx_edges(
         graph,
         pos,
-        ax=ax, # Draw on the specified Axes object
-        with_labels=True,
-        node_color=node_color,
-        node_size=node_size,
+        ax=ax,
+        node_size=node_size, # Lets arrows stop at the node boundary
+        edge_color=edge_color,
+        arrowsize=arrow_size,
+    )
+    nx.draw_networkx_labels(
+        graph,
+        pos,
+        ax=ax,
         font_size=font_size,
         font_weight=font_weight,
-        font_color=font_color, # Added font_color for labels
-        edge_color=edge_color, # Added edge_color
-        arrowsize=arrow_size,
+        font_color=font_color,
     )
+    ax.set_axis_off()
     ax.set_title(title, color=font_color) # Set title color for dark background
 
     try:
-        plt.savefig(output_path, facecolor=fig.get_facecolor()) # Ensure figure background is used in saved image
-        print(f"Graph saved to {output_path}")
+        fig.savefig(output_path, facecolor=fig.get_facecolor()) # Ensure figure background is used in saved image
+        logger.info("Graph saved to %s", output_path)
     except Exception as e:
-        print(f"Error saving graph to {output_path}: {e}")
-    finally:
-        plt.close(fig) # Close the specific figure
+        logger.error("Failed to save graph to %s: %s", output_path, e)
+
+    return pos if return_pos else None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", stream=sys.stdout)
     # Example usage (optional, for testing the visualizer directly)
     # Create a sample graph
     sample_graph = nx.DiGraph()
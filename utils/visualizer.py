@@ -5,9 +5,10 @@ from typing import Optional
 
 
 def style_nodes(pyvis_graph, nx_graph, settings: Optional[dict] = None):
+    get_node_data = nx_graph.nodes.get
     for pv_node in pyvis_graph.nodes:
         node_id = pv_node['id']
-        node_data = nx_graph.nodes.get(node_id, {})
+        node_data = get_node_data(node_id, {})
         node_type = node_data.get('type', 'unknown')
         
         pv_node['color'] = DEFAULT_NODE_COLOR